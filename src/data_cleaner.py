@@ -9,7 +9,8 @@ DataCleaner V2 - Nettoyage amélioré
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict
+import functools
+from typing import Dict, Tuple
 
 
 class DataCleaner:
@@ -18,6 +19,13 @@ class DataCleaner:
     Prépare les données pour comparaison inter-saisons
     """
     
+    # Motifs compilés une seule fois (alternation unique au lieu de 4 re.search)
+    _COMPOSITE_RE = re.compile(r'\+| - |/| vs ')
+    # Caractères parasites autour des valeurs numériques (ex: "1,234", "12%")
+    _NUMERIC_CLEAN_RE = re.compile(r'[,%\s]')
+    # Valeurs considérées comme vides une fois converties en texte
+    _EMPTY_TOKENS = frozenset({'', 'nan', 'NaN', 'None'})
+    
     def __init__(self, verbose: bool = True):
         """
         Initialise le nettoyeur
@@ -34,6 +42,7 @@ class DataCleaner:
             'removed_percentiles': False,
             'removed_composites': 0,
             'removed_empty': 0,
+            'converted_numeric': 0,
             'format': 'horizontal'
         }
     
@@ -51,23 +60,54 @@ class DataCleaner:
     
     def _is_composite_stat(self, stat_name: str) -> bool:
         """Détecte les stats composées (x+y, x-y, x/y)"""
-        composite_patterns = [r'\+', r' - ', r'\/', r' vs ']
-        for pattern in composite_patterns:
-            if re.search(pattern, str(stat_name)):
-                return True
-        return False
+        return self._COMPOSITE_RE.search(str(stat_name)) is not None
     
-    def _is_empty_category_row(self, row: pd.Series) -> bool:
+    def _empty_category_mask(self, df: pd.DataFrame) -> np.ndarray:
         """
-        Détecte les lignes vides qui sont des headers de catégories
+        Masque des lignes vides qui sont des headers de catégories
         Ex: "Passing", "", "" ou "Defense", "", ""
+        Calculé colonne par colonne (pas d'apply ligne à ligne)
+        """
+        if len(df.columns) < 2:
+            return np.zeros(len(df), dtype=bool)
+        first_filled = ~df.iloc[:, 0].astype(str).isin(self._EMPTY_TOKENS)
+        others = df.iloc[:, 1:]
+        others_empty = (others.isna() | others.astype(str).isin(self._EMPTY_TOKENS)).all(axis=1)
+        return (first_filled & others_empty).to_numpy()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _name_drop_flags(columns: Tuple[str, ...]) -> np.ndarray:
+        """
+        Colonnes à supprimer d'après leur seul nom (doublons, pourcentages, Percentile)
+        Mis en cache par schéma : tous les CSV FBref partagent les mêmes colonnes
         """
-        row_str = row.astype(str)
-        if row_str.iloc[0] and row_str.iloc[0] not in ['nan', 'NaN', '']:
-            other_cols = row_str.iloc[1:]
-            if all(val in ['', 'nan', 'NaN'] for val in other_cols):
-                return True
-        return False
+        names = pd.Index(columns)
+        drop = names.duplicated(keep='first')
+        # Recherches littérales (pas de moteur regex) pour '%' et 'Percentage'
+        drop |= np.asarray(names.str.contains('%', regex=False, na=False), dtype=bool)
+        drop |= np.asarray(names.str.contains('Percentage', regex=False, na=False), dtype=bool)
+        drop |= np.asarray(names == 'Percentile', dtype=bool)
+        drop.setflags(write=False)
+        return drop
+    
+    def _build_column_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calcule en une seule passe le masque des colonnes à conserver
+        (doublons de nom, pourcentages, Percentile, colonnes vides)
+        """
+        # Prédicats bon marché d'abord (noms, en cache), puis scans de valeurs
+        # uniquement sur les colonnes encore candidates
+        keep = ~self._name_drop_flags(tuple(df.columns.astype(str)))
+        candidates = np.flatnonzero(keep)
+        survivors = df.iloc[:, candidates]
+        
+        empty = survivors.isna().all(axis=0).to_numpy()
+        remaining = ~empty
+        empty[remaining] = survivors.iloc[:, remaining].astype(str).isin(self._EMPTY_TOKENS).all(axis=0).to_numpy()
+        
+        keep[candidates[empty]] = False
+        return keep
     
     def _remove_percentage_and_duplicate_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -75,34 +115,62 @@ class DataCleaner:
         Ex: "Shots on Target %" (vide) ou stats qui apparaissent 2 fois
         """
         initial_cols = len(df.columns)
-        columns_to_drop = []
-        
-        self._log("Suppression des colonnes dupliquées par nom...")
-        df_dedup = df.loc[:, ~df.columns.duplicated(keep='first')]
-        duplicates_removed = len(df.columns) - len(df_dedup.columns)
-        if duplicates_removed > 0:
-            self._log(f"Supprimé {duplicates_removed} colonne(s) dupliquée(s) ✓", "SUCCESS")
-        
-        for col in df_dedup.columns:
-            if '%' in str(col) or 'Percentage' in str(col):
-                columns_to_drop.append(col)
-                continue
-            if df_dedup[col].isna().all():
-                columns_to_drop.append(col)
-                continue
-            col_str = df_dedup[col].astype(str)
-            if (col_str == '').all() or (col_str == 'nan').all():
-                columns_to_drop.append(col)
-        
-        df_clean = df_dedup.drop(columns=columns_to_drop, errors='ignore')
+        
+        self._log("Suppression des colonnes dupliquées, % et vides (masque unique)...")
+        if self.verbose:
+            duplicates_removed = int(df.columns.duplicated(keep='first').sum())
+            if duplicates_removed > 0:
+                self._log(f"Supprimé {duplicates_removed} colonne(s) dupliquée(s) ✓", "SUCCESS")
+        
+        keep = self._build_column_mask(df)
+        df_clean = df.loc[:, keep]
+        
         removed = initial_cols - len(df_clean.columns)
-        if removed > 0:
+        if self.verbose and removed > 0:
             self._log(f"Supprimé {removed} colonne(s) au total (doublons + % vides) ✓", "SUCCESS")
-            if self.verbose and columns_to_drop:
-                self._log(f"Exemples de colonnes supprimées : {columns_to_drop[:5]}...")
+            self._log(f"Exemples de colonnes supprimées : {list(df.columns[~keep][:5])}...")
         
         return df_clean
     
+    def _downcast_numeric(self, series: pd.Series) -> pd.Series:
+        """
+        Réduit une colonne entière (sans NaN) au plus petit dtype int (int8/16/32)
+        Les stats fractionnaires restent en float64 : dtype stable d'un joueur à l'autre, sans perte
+        """
+        if series.notna().all() and (series % 1 == 0).all():
+            return pd.to_numeric(series, downcast='integer')
+        return series.astype('float64')
+    
+    def _convert_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convertit en numérique les stats stockées en texte (données fraîchement scrapées)
+        Les colonnes déjà numériques et les colonnes réellement textuelles sont laissées telles quelles
+        Les colonnes numériques entières sont ensuite réduites au plus petit dtype int (int8, int16...)
+        """
+        numeric_cols = {col: self._downcast_numeric(df[col])
+                        for col in df.select_dtypes(include='number').columns}
+        
+        # Conversion en bloc de toutes les colonnes texte (un seul apply)
+        converted = {}
+        text = df.select_dtypes(exclude=['number', 'bool'])
+        if not text.empty:
+            values = text.astype(str).replace(self._NUMERIC_CLEAN_RE, '', regex=True)
+            parsed = values.apply(pd.to_numeric, errors='coerce')
+            blank = text.isna() | (values == '')
+            convertible = parsed.notna().any() & (parsed.notna() | blank).all()
+            converted = {col: self._downcast_numeric(parsed[col])
+                         for col in parsed.columns[convertible.to_numpy()]}
+        
+        self.cleaning_report['converted_numeric'] = len(converted)
+        if self.verbose and converted:
+            self._log(f"{len(converted)} colonne(s) texte converties en numérique ✓", "SUCCESS")
+        if converted or numeric_cols:
+            # Affectation colonne par colonne (pas de assign(**...) : les libellés peuvent ne pas être des str)
+            df = df.copy()
+            for col, series in {**numeric_cols, **converted}.items():
+                df[col] = series
+        return df
+    
     def clean(self, df: pd.DataFrame, metadata: Dict = None) -> pd.DataFrame:
         """
         Nettoyage simple car données déjà en format horizontal (1 ligne = 1 saison)
@@ -114,40 +182,57 @@ class DataCleaner:
         Returns:
             DataFrame nettoyé avec métadonnées
         """
-        self._log("="*80)
-        self._log("DÉBUT DU NETTOYAGE", "START")
-        self._log("="*80)
+        if self.verbose:
+            self._log("="*80)
+            self._log("DÉBUT DU NETTOYAGE", "START")
+            self._log("="*80)
         
         self.cleaning_report['initial_rows'] = len(df)
         self.cleaning_report['initial_cols'] = len(df.columns)
-        self._log(f"Dimensions initiales : {df.shape[0]} lignes × {df.shape[1]} colonnes")
+        if self.verbose:
+            self._log(f"Dimensions initiales : {df.shape[0]} lignes × {df.shape[1]} colonnes")
         
-        df_clean = df.copy()
+        # Pas de copie : chaque étape suivante renvoie un nouvel objet, l'entrée n'est jamais modifiée
+        df_clean = df
         
-        # Ajouter métadonnées si fournies
-        if metadata:
-            for key, value in metadata.items():
-                if key not in df_clean.columns:
-                    df_clean.insert(0, key, value)
+        # Supprimer les lignes de catégories vides (avant l'ajout des métadonnées)
+        empty_rows = self._empty_category_mask(df)
+        self.cleaning_report['removed_empty'] = int(empty_rows.sum())
+        if empty_rows.any():
+            df_clean = df.loc[~empty_rows]
+            if self.verbose:
+                self._log(f"Supprimé {self.cleaning_report['removed_empty']} ligne(s) vide(s)/catégorie(s) ✓", "SUCCESS")
         
-        # Supprimer colonnes de pourcentages vides
-        df_clean = self._remove_percentage_and_duplicate_columns(df_clean)
+        # Ajouter métadonnées si fournies : un seul concat au lieu de N insert(0, ...)
+        # (ordre inversé conservé : la dernière clé insérée arrivait en tête)
+        if metadata:
+            missing = {key: value for key, value in reversed(metadata.items())
+                       if key not in df_clean.columns}
+            if missing:
+                meta_df = pd.DataFrame(missing, index=df_clean.index)
+                df_clean = pd.concat([meta_df, df_clean], axis=1)
         
         # Supprimer colonnes Percentile si présentes
         if "Percentile" in df_clean.columns:
-            df_clean = df_clean.drop(columns=["Percentile"])
             self.cleaning_report["removed_percentiles"] = True
             self._log("Colonne Percentile supprimée ✓", "SUCCESS")
         
+        # Doublons, pourcentages, Percentile et colonnes vides : un seul masque
+        df_clean = self._remove_percentage_and_duplicate_columns(df_clean)
+        
+        # Stats texte -> numérique
+        df_clean = self._convert_numeric_columns(df_clean)
+        
         # Rapport final
         self.cleaning_report["final_rows"] = len(df_clean)
         self.cleaning_report["final_cols"] = len(df_clean.columns)
         
-        self._log("\n" + "="*80)
-        self._log("NETTOYAGE TERMINÉ", "SUCCESS")
-        self._log("="*80)
-        self._log(f"Format : HORIZONTAL (1 ligne = 1 saison)")
-        self._log(f"Dimensions finales : {df_clean.shape[0]} ligne × {df_clean.shape[1]} colonnes")
+        if self.verbose:
+            self._log("\n" + "="*80)
+            self._log("NETTOYAGE TERMINÉ", "SUCCESS")
+            self._log("="*80)
+            self._log("Format : HORIZONTAL (1 ligne = 1 saison)")
+            self._log(f"Dimensions finales : {df_clean.shape[0]} ligne × {df_clean.shape[1]} colonnes")
         
         return df_clean
     
@@ -171,6 +256,8 @@ class DataCleaner:
         print(f"  • Percentile retiré       : {'✓ OUI' if report['removed_percentiles'] else '✗ NON'}")
         print(f"  • Lignes vides/catégories : {report['removed_empty']}")
         print(f"  • Stats composées         : {report['removed_composites']}")
+        print("\n🔢 Conversions :")
+        print(f"  • Colonnes texte → numérique : {report['converted_numeric']}")
         print(f"\n✅ Avantages du format horizontal :")
         print(f"  • 1 ligne = 1 joueur")
         print(f"  • Comparaisons directes inter-joueurs")
@@ -1,7 +1,7 @@
 """
-FBrefScraper V10 - Correction de l'import NumPy
-- Ajout de 'import numpy as np'
-- Correction de l'appel pd.np.random.rand() en np.random.rand()
+FBrefScraper V10 - Scouting reports FBref (Selenium, HTTP direct en option, cache disque)
+- NumPy sert à la détection vectorisée des colonnes Statistic / Per 90 du tableau
+- Jitter de politesse via random.random() (plus d'appel np.random)
 """
 
 from selenium import webdriver
@@ -9,23 +9,156 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 import time
 import re
-import numpy as np # <-- AJOUT DE L'IMPORT
+import os
+import gzip
+import hashlib
+import atexit
+import random
+import threading
+from datetime import date
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple, List
 
 
+# Motifs compilés une seule fois (minutes et métadonnées)
+_RE_MIN_STRONG = re.compile(r'Based on\s+<strong>(\d+)\s+minutes</strong>')
+_RE_MIN_TEXT = re.compile(r'Based on\s+(\d+)\s+minutes')
+# Position et taille lues en un seul passage sur le texte du bloc #meta
+_RE_META_FIELDS = re.compile(r'Position:\s*(?P<position>\w+)|(?P<height>\d+)cm')
+
+# URLs, liens de scouting reports et noms de stats
+_RE_PLAYER_ID = re.compile(r'players/([a-f0-9]+)/')
+_RE_PLAYER_BASE_URL = re.compile(r'(https://fbref.com/en/players/[a-f0-9]+/)')
+_RE_PLAYER_SLUG = re.compile(r'/([A-Za-z-]+)$')
+_RE_SEASON = re.compile(r'(\d{4}-\d{4})')
+_RE_YEAR = re.compile(r'(\d{4})')
+_RE_SCOUT_HREF = re.compile(r'/scout/')
+_RE_COMP_FROM_HREF = re.compile(r'/scout/\d+/(.*?)-Scouting-Report')
+_RE_LEADING_ID = re.compile(r'^\d+\s*')
+_RE_STAT_NAME_SEP = re.compile(r'[^\w%]+')
+_RE_STAT_HEADERS = re.compile(r'Statistic|Per 90|Percentile', re.IGNORECASE)
+
+# Expressions XPath compilées une seule fois (scouting report lu avec lxml, sans BeautifulSoup)
+_XP_SCOUT_TABLES = etree.XPath('//table[starts-with(@id, "scout_full_")]')
+_XP_REPORT_FOOTERS = etree.XPath('//div[contains(@class, "footer") and contains(@id, "tfooter_scout_full_")]')
+_XP_BASED_ON = etree.XPath('//text()[contains(., "Based on")]')
+_XP_HEADER_CELLS = etree.XPath('./thead/tr[last()]/*[self::th or self::td]')
+_XP_BODY_ROWS = etree.XPath('./tbody/tr')
+_XP_ROW_CELLS = etree.XPath('./*[self::th or self::td]')
+
+# Driver Chrome partagé entre instances (shared=True), fermé à la sortie de l'interpréteur
+_SHARED_DRIVER = None
+_SHARED_LOCK = threading.Lock()
+
+# Début de la dernière requête vers FBref, partagé par tous les scrapers et threads (limite de débit)
+_REQUEST_LOCK = threading.Lock()
+_LAST_REQUEST_START = 0.0
+
+
+def _cleanup_shared_driver():
+    """Ferme le driver partagé (appelé par atexit)"""
+    global _SHARED_DRIVER
+    with _SHARED_LOCK:
+        if _SHARED_DRIVER is not None:
+            try:
+                _SHARED_DRIVER.quit()
+            except Exception:
+                pass
+            _SHARED_DRIVER = None
+
+
+atexit.register(_cleanup_shared_driver)
+
+
 class FBrefScraper:
     """Scraper FBref avec attente robuste et sélection de la bonne table"""
     
-    def __init__(self, wait_time: int = 20, headless: bool = True):
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    # Intervalle minimal (s) entre deux requêtes réseau, tous threads confondus (FBref : ~10 requêtes/min)
+    MIN_REQUEST_INTERVAL = 6.0
+    # Marqueurs d'une page de challenge Cloudflare (HTTP direct refusé)
+    _CLOUDFLARE_MARKERS = ('cf-challenge', 'challenge-platform', 'Just a moment...')
+    # Ressources jamais lues par le scraper, bloquées côté réseau via CDP
+    _BLOCKED_URLS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.mp4',
+        '*google-analytics*', '*googletagmanager*', '*doubleclick*', '*adsbygoogle*',
+        '*googlesyndication*'
+    ]
+    _BLOCKED_FONT_URLS = ['*.woff', '*.woff2', '*.ttf', '*.otf']
+    # La préférence Chrome "stylesheets" n'est plus appliquée : les CSS sont bloquées au niveau réseau
+    _BLOCKED_STYLE_URLS = ['*.css']
+    HTTP_POOL_SIZE = 16
+    
+    def __init__(self, wait_time: int = 20, headless: bool = True,
+                 cache_dir: Optional[str] = None, cache_ttl: int = 24 * 3600,
+                 use_http: bool = False, fast_mode: bool = False, shared: bool = False,
+                 user_data_dir: Optional[str] = None):
+        """
+        Args:
+            wait_time: Attente max (s) des éléments de la page
+            headless: Chrome sans interface
+            cache_dir: Dossier du cache HTML sur disque (désactivé si None)
+            cache_ttl: Durée de validité (s) d'une page en cache
+            use_http: Tenter un GET HTTP direct avant Selenium (repli automatique)
+            fast_mode: Bloquer aussi CSS, polices et plugins (peut gêner le challenge Cloudflare)
+            shared: Réutiliser le Chrome du module (gardé ouvert jusqu'à la sortie du programme,
+                    options du premier scraper qui l'a créé)
+            user_data_dir: Profil Chrome persistant (cache HTTP/TLS conservé entre les runs).
+                           Réutiliser une même instance pour N joueurs, close() en fin de lot
+        """
         self.wait_time = wait_time 
         self.headless = headless
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.use_http = use_http
+        self.fast_mode = fast_mode
+        self.shared = shared
+        self.user_data_dir = user_data_dir
         self.driver = None
-        self._setup_driver()
+        self._session = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        if use_http:
+            self._session = requests.Session()
+            self._session.headers.update({'User-Agent': self.USER_AGENT})
+            # Session partagée par les threads de _scrape_reports_parallel : pool dimensionné en conséquence
+            adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+        if shared:
+            self._acquire_shared_driver()
+        else:
+            self._setup_driver()
+    
+    def _acquire_shared_driver(self):
+        """Récupère le driver partagé, en le (re)créant au premier appel ou s'il ne répond plus"""
+        global _SHARED_DRIVER
+        with _SHARED_LOCK:
+            if _SHARED_DRIVER is not None:
+                try:
+                    _SHARED_DRIVER.current_url
+                except Exception:  # WebDriverException, ou chromedriver injoignable (urllib3)
+                    print("⚠️  Driver partagé inutilisable (session fermée ou crash), recréation...")
+                    try:
+                        _SHARED_DRIVER.quit()
+                    except Exception:
+                        pass
+                    _SHARED_DRIVER = None
+            if _SHARED_DRIVER is None:
+                self._setup_driver()
+                _SHARED_DRIVER = self.driver
+            else:
+                self.driver = _SHARED_DRIVER
+                print("✅ Driver partagé réutilisé")
     
     def _setup_driver(self):
         """Configure Chrome"""
@@ -36,17 +169,129 @@ class FBrefScraper:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        chrome_options.add_argument(f'user-agent={self.USER_AGENT}')
+        # Services Chrome inutiles pour le scraping (démarrage plus court)
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-translate')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--disable-features=TranslateUI')
+        if self.user_data_dir:
+            chrome_options.add_argument(f'--user-data-dir={self.user_data_dir}')
+            chrome_options.add_argument('--disk-cache-size=268435456')
+        # DOM prêt suffit (les tableaux sont du HTML pur) : pas d'attente des images/ressources
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        prefs = {'profile.managed_default_content_settings.images': 2}
+        if self.fast_mode:
+            # Les CSS sont bloquées via CDP (_BLOCKED_STYLE_URLS), la préférence "stylesheets" étant ignorée
+            prefs.update({
+                'profile.managed_default_content_settings.fonts': 2,
+                'profile.managed_default_content_settings.plugins': 2
+            })
+        chrome_options.add_experimental_option('prefs', prefs)
         
         self.driver = webdriver.Chrome(options=chrome_options)
+        # Aucune attente implicite : toutes les attentes passent par WebDriverWait
+        self.driver.implicitly_wait(0)
+        self._block_resources()
         print("✅ Driver initialisé")
     
+    def _block_resources(self):
+        """Bloque images, médias, trackers/pubs (et polices/CSS en fast_mode) via le protocole CDP"""
+        blocked = self._BLOCKED_URLS + (self._BLOCKED_FONT_URLS + self._BLOCKED_STYLE_URLS if self.fast_mode else [])
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+        except (WebDriverException, AttributeError) as e:
+            print(f"   (Blocage CDP indisponible : {str(e)[:80]})")
+    
+    def _get_html(self) -> str:
+        """HTML courant lu via CDP (Runtime.evaluate), page_source en repli"""
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': 'document.documentElement.outerHTML',
+                'returnByValue': True
+            })
+            return result['result']['value']
+        except (WebDriverException, AttributeError, KeyError):
+            return self.driver.page_source
+    
+    def _cache_path(self, url: str) -> Optional[str]:
+        """Chemin du fichier cache d'une URL (sha256 de l'URL, HTML gzippé)"""
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.html.gz")
+    
+    def _read_cached_html(self, url: str) -> Optional[str]:
+        """Retourne le HTML en cache s'il existe et n'a pas expiré"""
+        path = self._cache_path(url)
+        if not path or not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) >= self.cache_ttl:
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                html = f.read()
+            print("   💾 Page chargée depuis le cache")
+            return html
+        except (OSError, EOFError) as e:
+            print(f"   ⚠️  Cache illisible, rechargement: {e}")
+            return None
+    
+    def _write_cached_html(self, url: str, html: str):
+        """Enregistre le HTML d'une page dans le cache (si activé)"""
+        path = self._cache_path(url)
+        if not path:
+            return
+        try:
+            with gzip.open(path, 'wt', encoding='utf-8') as f:
+                f.write(html)
+        except OSError as e:
+            print(f"   ⚠️  Écriture cache impossible: {e}")
+    
+    def _fetch_http(self, url: str, marker: str) -> Optional[str]:
+        """
+        GET HTTP direct (sans navigateur) si use_http est activé
+        Retourne None (-> repli Selenium) en cas d'erreur, de challenge Cloudflare
+        ou si la page ne contient pas le marqueur attendu
+        """
+        if self._session is None:
+            return None
+        try:
+            self._throttle()
+            response = self._session.get(url, timeout=15)
+        except requests.RequestException as e:
+            print(f"   (HTTP direct indisponible : {str(e)[:80]}, repli Selenium)")
+            return None
+        
+        html = response.text
+        if (response.status_code != 200 or marker not in html
+                or any(m in html for m in self._CLOUDFLARE_MARKERS)):
+            print(f"   (HTTP direct refusé [{response.status_code}], repli Selenium)")
+            return None
+        
+        # FBref livre une partie des tableaux en commentaires HTML (décommentés par le JS)
+        html = html.replace('<!--', '').replace('-->', '')
+        print("   ⚡ Page chargée en HTTP direct")
+        self._write_cached_html(url, html)
+        return html
+    
     def _safe_get_page(self, url: str, max_retries: int = 3) -> bool:
         """Charge une page avec retry et gestion des cookies"""
         for attempt in range(max_retries):
             try:
+                self._throttle()
                 self.driver.get(url)
-                time.sleep(2) 
+                # DOM prêt (stratégie 'eager') au lieu d'un sleep fixe de 2s
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        lambda d: d.execute_script('return document.readyState') in ('interactive', 'complete')
+                    )
+                except TimeoutException:
+                    pass
                 
                 # --- GESTION COOKIES ---
                 try:
@@ -55,7 +300,13 @@ class FBrefScraper:
                     )
                     cookie_button.click()
                     print("   🍪 Cookie consent cliqué.")
-                    time.sleep(1) 
+                    # Attendre la disparition du bandeau plutôt qu'un sleep fixe
+                    try:
+                        WebDriverWait(self.driver, 5).until(
+                            EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.fc-consent-root"))
+                        )
+                    except TimeoutException:
+                        pass
                 except (TimeoutException, NoSuchElementException):
                     print("   (Pas de banner cookie trouvé, ou déjà accepté)")
                 # --- FIN ---
@@ -69,29 +320,64 @@ class FBrefScraper:
                     time.sleep(3)
         return False
     
-    def _extract_minutes_from_description(self, soup: BeautifulSoup) -> Optional[float]:
-        """Extrait les minutes depuis la description "Based on X minutes played" """
+    def _throttle(self):
+        """
+        Attend que l'intervalle minimal depuis le début de la dernière requête soit écoulé (+ jitter)
+        Le créneau est réservé sous verrou : N threads n'envoient pas N fois plus de requêtes
+        """
+        global _LAST_REQUEST_START
+        with _REQUEST_LOCK:
+            now = time.monotonic()
+            start = max(now, _LAST_REQUEST_START + self.MIN_REQUEST_INTERVAL + random.random())
+            _LAST_REQUEST_START = start
+        if start > now:
+            time.sleep(start - now)
+    
+    def _extract_minutes_from_description(self, tree,
+                                          html: Optional[str] = None) -> Optional[float]:
+        """
+        Extrait les minutes depuis la description "Based on X minutes played"
+        Si le HTML brut est fourni, le regex y est appliqué d'abord (à partir du footer
+        scout_full_) avant tout parcours de l'arbre lxml
+        """
         try:
+            if html:
+                footer_pos = html.find('tfooter_scout_full_')
+                if footer_pos >= 0:
+                    match = _RE_MIN_STRONG.search(html, footer_pos)
+                    if match:
+                        minutes = int(match.group(1))
+                        print(f"   ⏱️  Minutes extraites (footer) : {minutes}")
+                        return float(minutes)
+            
             # Cibler plus spécifiquement le footer pour les minutes
-            footer_div = soup.find('div', class_='footer no_hide_long', id=re.compile(r'tfooter_scout_full_'))
-            if footer_div:
-                 match = re.search(r'Based on\s+<strong>(\d+)\s+minutes</strong>', str(footer_div))
-                 if match:
+            footers = _XP_REPORT_FOOTERS(tree)
+            if footers:
+                footer_div = footers[0]
+                # Lecture directe du <strong>N minutes</strong>, texte du footer sinon (pas de sérialisation)
+                strong = footer_div.find('.//strong')
+                strong_text = strong.text_content().strip() if strong is not None else ''
+                value = strong_text.split()[0] if 'minutes' in strong_text else ''
+                if value.isdigit():
+                    minutes = int(value)
+                    print(f"   ⏱️  Minutes extraites (footer) : {minutes}")
+                    return float(minutes)
+                match = _RE_MIN_TEXT.search(footer_div.text_content())
+                if match:
                     minutes = int(match.group(1))
                     print(f"   ⏱️  Minutes extraites (footer) : {minutes}")
                     return float(minutes)
             
             # Fallback si non trouvé dans le footer spécifique (ancienne méthode)
-            for div in soup.find_all('div'):
-                text = div.get_text()
-                if 'Based on' in text and 'minutes' in text:
-                    match = re.search(r'Based on\s+<strong>(\d+)\s+minutes</strong>', str(div))
-                    if match:
-                        minutes = int(match.group(1))
-                        print(f"   ⏱️  Minutes extraites (fallback) : {minutes}")
-                        return float(minutes)
-                    
-                    match = re.search(r'Based on\s+(\d+)\s+minutes', text)
+            # Seuls les noeuds texte contenant "Based on" sont visités (pas de get_text sur chaque div)
+            for node in _XP_BASED_ON(tree):
+                parent = node.getparent()
+                if parent is not None and node.is_tail:
+                    parent = parent.getparent()
+                text = parent.text_content() if parent is not None else str(node)
+                if 'minutes' in text:
+                    # Le texte contient déjà "Based on N minutes" (balises <strong> retirées)
+                    match = _RE_MIN_TEXT.search(text)
                     if match:
                         minutes = int(match.group(1))
                         print(f"   ⏱️  Minutes extraites (fallback) : {minutes}")
@@ -111,29 +397,28 @@ class FBrefScraper:
         try:
             meta_info = soup.find('div', {'id': 'meta'})
             if meta_info:
-                # Position
-                position_p = meta_info.find('p', string=re.compile(r'Position:'))
-                if position_p:
-                     pos_text = position_p.get_text(strip=True)
-                     match = re.search(r'Position:\s*(\w+)', pos_text)
-                     if match:
-                         metadata['position'] = match.group(1).split(',')[0] 
+                # Position et taille : un seul finditer sur le texte du bloc (1re occurrence retenue)
+                fields = {}
+                for match in _RE_META_FIELDS.finditer(meta_info.get_text(' ')):
+                    for key, value in match.groupdict().items():
+                        if value:
+                            fields.setdefault(key, value)
+                if 'position' in fields:
+                    metadata['position'] = fields['position'].split(',')[0]
 
                 # Âge
                 birth_info = meta_info.find('span', {'id': 'necro-birth'})
                 if birth_info:
                     birth_date = birth_info.get('data-birth', '')
                     if birth_date:
-                        from datetime import datetime
-                        birth_year = int(birth_date.split('-')[0])
-                        metadata['age'] = datetime.now().year - birth_year
+                        # Âge exact (anniversaire passé ou non), data-birth au format ISO
+                        birth = date.fromisoformat(birth_date)
+                        today = date.today()
+                        metadata['age'] = today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
                 
                 # Taille
-                height_p = meta_info.find('p', string=re.compile(r'\d+cm'))
-                if height_p:
-                     height_match = re.search(r'(\d+)cm', height_p.get_text())
-                     if height_match:
-                        metadata['height_cm'] = int(height_match.group(1))
+                if 'height' in fields:
+                    metadata['height_cm'] = int(fields['height'])
         
         except Exception as e:
             print(f"   ⚠️  Erreur métadonnées: {e}")
@@ -169,12 +454,12 @@ class FBrefScraper:
     def _normalize_player_url(self, url: str) -> str:
         """Normalise URL pour extraire page principale"""
         if '/scout/' in url:
-            match = re.search(r'players/([a-f0-9]+)/', url)
+            match = _RE_PLAYER_ID.search(url)
             if match:
                 player_id = match.group(1)
-                base_url_match = re.match(r'(https://fbref.com/en/players/[a-f0-9]+/)', url)
+                base_url_match = _RE_PLAYER_BASE_URL.match(url)
                 if base_url_match:
-                     name_match = re.search(r'/([A-Za-z-]+)$', url.split('/scout/')[0])
+                     name_match = _RE_PLAYER_SLUG.search(url.split('/scout/')[0])
                      if name_match:
                         player_name = name_match.group(1)
                         return f"{base_url_match.group(1)}{player_name}"
@@ -189,51 +474,68 @@ class FBrefScraper:
         player_main_url = self._normalize_player_url(player_url)
         print(f"   📍 URL principale: {player_main_url}")
         
-        if not self._safe_get_page(player_main_url):
-            print("   ❌ Impossible de charger la page principale.")
-            return []
+        html = self._read_cached_html(player_main_url) or self._fetch_http(player_main_url, '/scout/')
+        if html is None:
+            if not self._safe_get_page(player_main_url):
+                print("   ❌ Impossible de charger la page principale.")
+                return []
+            html = self._get_html()
+            # Mise en cache seulement d'une vraie page joueur (pas d'un challenge Cloudflare ou d'un DOM incomplet)
+            if ('/scout/' in html and 'Scouting-Report' in html
+                    and not any(m in html for m in self._CLOUDFLARE_MARKERS)):
+                self._write_cached_html(player_main_url, html)
         
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        # Recherche limitée aux blocs de navigation (seul le bloc visé est matérialisé),
+        # liens /scout/ du document entier en dernier recours
+        links = []
+        for strainer in (SoupStrainer('div', id='inner_nav'),
+                         SoupStrainer('ul', id='bottom_nav_container'),
+                         SoupStrainer('a', href=_RE_SCOUT_HREF)):
+            soup = BeautifulSoup(html, 'lxml', parse_only=strainer)
+            links = soup.find_all('a', href=_RE_SCOUT_HREF)
+            if links:
+                break
         scouting_reports = []
+        seen_urls = set()  # dédoublonnage à l'insertion
         
-        scouting_section = soup.find('div', id='inner_nav') 
-        if not scouting_section:
-             scouting_section = soup 
-
-        links = scouting_section.find_all('a', href=re.compile(r'/scout/'))
         print(f"   🔎 {len(links)} liens potentiels trouvés...")
+        
+        # Saison en cours calculée une seule fois (date système)
+        # Si nous sommes en Octobre 2025, la saison en cours est 2025-2026
+        today = date.today()
+        season_start = today.year if today.month >= 7 else today.year - 1
+        current_season = f"{season_start}-{season_start + 1}"
 
         for link in links:
             href = link.get('href', '')
             if 'Scouting-Report' in href: 
                 link_text = link.get_text(strip=True)
+                if not link_text:
+                    continue
                 
                 if exclude_365_days and ('Last 365 Days' in link_text or '365_m1' in href):
                     continue
                 
                 full_url = f"https://fbref.com{href}" if href.startswith('/') else href
+                if full_url in seen_urls:
+                    continue
+                seen_urls.add(full_url)
                 
-                season_match = re.search(r'(\d{4}-\d{4})', link_text)
+                season_match = _RE_SEASON.search(link_text)
                 season = "Unknown" 
                 if season_match:
                     season = season_match.group(1)
                 elif 'Last 365 Days' in link_text or '365_m1' in href:
-                    current_year = pd.Timestamp.now().year
-                    current_month = pd.Timestamp.now().month
-                    season_start = current_year - 1 if current_month < 7 else current_year
-                    # Correction pour la saison actuelle basée sur la date système
-                    # Si nous sommes en Octobre 2025, la saison en cours est 2025-2026
-                    season_start_correct = current_year if current_month >= 7 else current_year -1
-                    season = f"{season_start_correct}-{season_start_correct + 1}"
-
-                elif re.search(r'(\d{4})', link_text): 
-                     year = re.search(r'(\d{4})', link_text).group(1)
+                    season = current_season
+
+                elif (year_match := _RE_YEAR.search(link_text)): 
+                     year = year_match.group(1)
                      # Assumons que l'année mentionnée est l'année de début de saison
                      season = f"{year}-{int(year)+1}"
                 
                 competition = link_text.replace(season, '').replace('Scouting Report', '').strip()
                 if not competition or competition == season: 
-                    comp_match = re.search(r'/scout/\d+/(.*?)-Scouting-Report', href)
+                    comp_match = _RE_COMP_FROM_HREF.search(href)
                     if comp_match:
                          # Extraction plus générique du nom du joueur pour le retirer
                          player_name_in_url_part = full_url.split('/scout/')[0].split('/')[-1]
@@ -249,46 +551,85 @@ class FBrefScraper:
                     'text': link_text 
                 })
         
-        seen_urls = set()
-        unique_reports = []
-        for report in scouting_reports:
-            if report['url'] not in seen_urls:
-                seen_urls.add(report['url'])
-                unique_reports.append(report)
-        
-        if unique_reports:
-            print(f"✅ {len(unique_reports)} scouting reports uniques trouvés:")
-            for i, report in enumerate(unique_reports, 1):
+        if scouting_reports:
+            print(f"✅ {len(scouting_reports)} scouting reports uniques trouvés:")
+            for i, report in enumerate(scouting_reports, 1):
                 # Nettoyage affichage compétition si contient des chiffres seuls (potentiellement ID)
-                display_comp = re.sub(r'^\d+\s*', '', report['competition']).strip()
+                display_comp = _RE_LEADING_ID.sub('', report['competition']).strip()
                 print(f"   {i}. {report['season']} - {display_comp} ('{report['text']}')")
         else:
             print(f"❌ Aucun scouting report trouvé")
         
-        return unique_reports
+        return scouting_reports
     
-    def _scrape_single_report(self, url: str, season: str, 
-                             competition: str) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
-        """ Scrape un seul scouting report en attendant le footer """
-        if not self._safe_get_page(url):
-            return None, None
+    def _wait_for_report(self, url: str) -> str:
+        """ Attend le footer puis les lignes du tableau, retourne le HTML (mis en cache) """
+        wait_condition = (By.CSS_SELECTOR, "div.footer.no_hide_long strong")
+        print(f"      -> Attente du footer ({self.wait_time}s max)...")
         
+        WebDriverWait(self.driver, self.wait_time).until(
+            EC.presence_of_element_located(wait_condition)
+        )
+        print("      -> Footer trouvé.")
+        
+        # Attendre que les lignes du tableau soient rendues (au lieu d'un sleep fixe)
         try:
-            wait_condition = (By.CSS_SELECTOR, "div.footer.no_hide_long strong")
-            print(f"      -> Attente du footer ({self.wait_time}s max)...")
-            
             WebDriverWait(self.driver, self.wait_time).until(
-                EC.presence_of_element_located(wait_condition)
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'table[id^="scout_full_"] tbody tr'))
             )
-            print("      -> Footer trouvé.")
+            rows_found = True
+        except TimeoutException:
+            rows_found = False
+            print("      -> Lignes du tableau non détectées, lecture de la page telle quelle.")
+        
+        html = self._get_html()
+        if rows_found:
+            self._write_cached_html(url, html)
+        return html
+    
+    def _table_to_dataframe(self, table, body_rows) -> pd.DataFrame:
+        """
+        Construit le DataFrame directement depuis les lignes <tr> du tableau (éléments lxml)
+        En-têtes : dernière ligne du <thead> (équivalent du niveau utile de read_html)
+        """
+        headers = [cell.text_content().strip() for cell in _XP_HEADER_CELLS(table)]
+        
+        rows = [[cell.text_content().strip() for cell in _XP_ROW_CELLS(tr)]
+                for tr in body_rows]
+        width = len(headers) or max((len(r) for r in rows), default=0)
+        rows = [(r + [None] * width)[:width] for r in rows]
+        
+        return pd.DataFrame(rows, columns=headers or None)
+    
+    def _scrape_single_report(self, url: str, season: str, 
+                             competition: str,
+                             metadata: Optional[Dict] = None) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
+        """
+        Scrape un seul scouting report en attendant le footer
+        Si un dict metadata est fourni, il est complété avec les métadonnées (bloc #meta) de la page
+        """
+        html = self._read_cached_html(url) or self._fetch_http(url, 'scout_full_')
+        loaded = html is not None
+        if not loaded and not self._safe_get_page(url):
+            return None, None
+        
+        try:
+            # Métadonnées lues sur la page déjà chargée (pas de second chargement), avant l'attente
+            # du footer : le bloc #meta est récupéré même si le tableau n'apparaît jamais
+            if metadata is not None:
+                soup_meta = BeautifulSoup(html if loaded else self._get_html(), 'lxml',
+                                          parse_only=SoupStrainer('div', id='meta'))
+                metadata.update(self._extract_metadata_from_page(soup_meta, metadata['name']))
             
-            time.sleep(3) 
+            if not loaded:
+                html = self._wait_for_report(url)
             
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Parsing lxml direct (pas d'arbre BeautifulSoup) : footer et tableau lus par XPath
+            tree = lxml_html.fromstring(html)
             
-            minutes_played = self._extract_minutes_from_description(soup)
+            minutes_played = self._extract_minutes_from_description(tree, html)
             
-            all_scout_tables = soup.find_all('table', {'id': re.compile(r'^scout_full_')})
+            all_scout_tables = _XP_SCOUT_TABLES(tree)
             
             if not all_scout_tables:
                 print(f"   ⚠️  Aucune table (id commençant par 'scout_full_') trouvée après l'attente.")
@@ -298,34 +639,26 @@ class FBrefScraper:
             table_id_found = table.get('id')
             print(f"      -> Tableau complet trouvé : {table_id_found}")
             
-            tbody = table.find('tbody')
-            if not tbody or not tbody.find_all('tr'):
+            body_rows = _XP_BODY_ROWS(table)
+            if not body_rows:
                 print(f"   ⚠️  Tableau '{table_id_found}' est vide.")
                 return None, minutes_played
             
-            try:
-                df_list = pd.read_html(str(table))
-                if not df_list:
-                    print(f"   ⚠️  pd.read_html n'a retourné aucune table pour '{table_id_found}'.")
-                    return None, minutes_played
-                df = df_list[0]
-            except ValueError as e:
-                print(f"   ⚠️  Erreur pandas lors de la lecture de la table '{table_id_found}': {e}")
-                return None, minutes_played
+            # Lecture directe des cellules du tableau déjà parsé (pas de str(table) + read_html)
+            df = self._table_to_dataframe(table, body_rows)
 
             if df.empty or len(df) < 3:
                 print(f"   ⚠️  DataFrame extrait de '{table_id_found}' est trop petit ou vide.")
                 return None, minutes_played
             
-            stat_col = None
-            per90_col = None
-            
-            for col in df.columns:
-                col_str = str(col).lower().strip()
-                if 'statistic' in col_str:
-                    stat_col = col
-                elif 'per' in col_str and '90' in col_str:
-                    per90_col = col
+            # Détection vectorisée des colonnes Statistic / Per 90 (dernière occurrence retenue)
+            col_names = df.columns.map(str).str.lower().str.strip()
+            is_stat = np.asarray(col_names.str.contains('statistic', regex=False), dtype=bool)
+            is_per90 = ~is_stat & np.asarray(col_names.str.contains('per', regex=False) & col_names.str.contains('90', regex=False), dtype=bool)
+            stat_hits = np.flatnonzero(is_stat)
+            per90_hits = np.flatnonzero(is_per90)
+            stat_col = df.columns[stat_hits[-1]] if len(stat_hits) else None
+            per90_col = df.columns[per90_hits[-1]] if len(per90_hits) else None
             
             if stat_col is None and len(df.columns) >= 1: stat_col = df.columns[0]
             if per90_col is None and len(df.columns) >= 2: per90_col = df.columns[1]
@@ -334,32 +667,36 @@ class FBrefScraper:
                  print(f"   ⚠️  Impossible de trouver les colonnes 'Statistic' ou 'Per 90' dans la table '{table_id_found}'. Colonnes: {df.columns}")
                  return None, minutes_played
 
-            df_clean = df.copy()
-            df_clean = df_clean[pd.to_numeric(df_clean[per90_col], errors='coerce').notna()]
-            df_clean = df_clean[df_clean[stat_col].notna()]
-            df_clean = df_clean[df_clean[stat_col].astype(str).str.strip() != ""]
-            df_clean = df_clean[~df_clean[stat_col].astype(str).str.contains("Statistic|Per 90|Percentile", case=False, regex=True)] 
-
-            stats_dict = {}
-            for _, row in df_clean.iterrows():
-                stat_name = str(row[stat_col]).strip()
-                stat_value = str(row[per90_col]).strip()
-                stat_name_clean = re.sub(r'[^\w%]+', '_', stat_name) 
-                stat_name_clean = stat_name_clean.replace('%','pct').strip('_') 
-                if stat_name_clean: 
-                    stats_dict[stat_name_clean] = stat_value
+            # Conversion texte de la colonne Statistic faite une seule fois
+            stat_str = df[stat_col].astype(str).str.strip()
+            # Séparateur de milliers retiré comme le faisait read_html (thousands=',') : "1,509.57" -> "1509.57"
+            per90_str = df[per90_col].astype(str).str.strip().str.replace(',', '', regex=False)
+            # Tous les filtres combinés en un seul masque, une seule indexation (pas de copie préalable)
+            keep = (pd.to_numeric(per90_str, errors='coerce').notna()
+                    & df[stat_col].notna()
+                    & (stat_str != "")
+                    & ~stat_str.str.contains(_RE_STAT_HEADERS))
+            df_clean = df.loc[keep]
+
+            # Noms de stats normalisés et valeurs en opérations vectorisées (pas d'iterrows)
+            names = (stat_str.loc[df_clean.index]
+                     .str.replace(_RE_STAT_NAME_SEP, '_', regex=True)
+                     .str.replace('%', 'pct', regex=False)
+                     .str.strip('_'))
+            values = per90_str.loc[df_clean.index]
+            valid = names != ''
+            stats_dict = dict(zip(names[valid].tolist(), values[valid].tolist()))
             
             if not stats_dict:
                  print(f"   ⚠️  Aucune stat valide extraite après nettoyage pour la table '{table_id_found}'.")
                  return None, minutes_played
 
-            df_horizontal = pd.DataFrame([stats_dict])
-            
-            df_horizontal.insert(0, 'season', season)
-            df_horizontal.insert(1, 'competition', competition)
-            
+            # Ligne complète (contexte + stats) construite en une seule fois
+            row = {'season': season, 'competition': competition}
             if minutes_played:
-                df_horizontal.insert(2, 'minutes_played', minutes_played)
+                row['minutes_played'] = minutes_played
+            row.update(stats_dict)
+            df_horizontal = pd.DataFrame([row])
             
             return df_horizontal, minutes_played
         
@@ -372,9 +709,53 @@ class FBrefScraper:
             traceback.print_exc() 
             return None, None
     
+    def _scrape_reports_parallel(self, reports: List[Dict],
+                                 max_workers: int) -> List[Tuple[Optional[pd.DataFrame], Optional[float]]]:
+        """
+        Scrape plusieurs rapports en parallèle, un driver Chrome par thread (créé à la demande)
+        Headless et --disable-dev-shm-usage sont indispensables au-delà de 3-4 navigateurs
+        Les workers n'utilisent pas user_data_dir (un profil Chrome est verrouillé par son navigateur)
+        En mode use_http, les workers réutilisent la session HTTP (et ses connexions) de l'instance
+        """
+        local = threading.local()
+        scrapers = []
+        
+        def worker(report: Dict) -> Tuple[Optional[pd.DataFrame], Optional[float]]:
+            # Toute erreur (démarrage de Chrome compris) compte comme un échec du rapport,
+            # sans interrompre les autres ni perdre le premier rapport déjà scrapé
+            try:
+                scraper = getattr(local, 'scraper', None)
+                if scraper is None:
+                    scraper = FBrefScraper(wait_time=self.wait_time, headless=self.headless,
+                                           cache_dir=self.cache_dir, cache_ttl=self.cache_ttl,
+                                           fast_mode=self.fast_mode)
+                    scraper._session = self._session
+                    local.scraper = scraper
+                    scrapers.append(scraper)
+                return scraper._scrape_single_report(
+                    url=report['url'],
+                    season=report['season'],
+                    competition=report['competition']
+                )
+            except Exception as e:
+                print(f"   ❌ Erreur worker ({report['season']} - {report['competition'][:40]}) : {e}")
+                return None, None
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(worker, reports))
+        finally:
+            for scraper in scrapers:
+                scraper._session = None  # la session appartient à l'instance principale
+                scraper.close()
+    
     def scrape_player_all_seasons(self, player_url: str, player_name: str, 
-                                  exclude_365_days: bool = False) -> Tuple[pd.DataFrame, Dict, List[Dict]]:
-        """ Scrape toutes les saisons avec la nouvelle logique d'attente/sélection """
+                                  exclude_365_days: bool = False,
+                                  max_workers: int = 1) -> Tuple[pd.DataFrame, Dict, List[Dict]]:
+        """
+        Scrape toutes les saisons avec la nouvelle logique d'attente/sélection
+        max_workers > 1 : rapports scrapés en parallèle (un navigateur par thread)
+        """
         print(f"\n{'='*80}")
         print(f"🎯 SCRAPING MULTI-SAISONS - {player_name}")
         print(f"{'='*80}")
@@ -392,11 +773,48 @@ class FBrefScraper:
                  return None, {'name': player_name, 'position': 'Unknown'}, []
 
         first_report_url_meta = scouting_reports[0]['url']
-        metadata = {'name': player_name, 'position': 'Unknown'} 
+        # Métadonnées extraites pendant le scraping du premier rapport (pas de chargement dédié)
+        page_metadata = {'name': player_name}
+        all_seasons_data = []
         
-        if self._safe_get_page(first_report_url_meta):
-            soup_meta = BeautifulSoup(self.driver.page_source, 'html.parser')
-            metadata = self._extract_metadata_from_page(soup_meta, player_name)
+        print(f"\n🔄 Scraping {len(scouting_reports)} saison(s)/rapport(s)...")
+        
+        if max_workers > 1 and len(scouting_reports) > 1:
+            first = scouting_reports[0]
+            results = [self._scrape_single_report(
+                url=first['url'],
+                season=first['season'],
+                competition=first['competition'],
+                metadata=page_metadata
+            )]
+            print(f"   ⚡ {min(max_workers, len(scouting_reports) - 1)} navigateur(s) en parallèle")
+            results += self._scrape_reports_parallel(scouting_reports[1:], max_workers)
+            for report, (df_season, minutes) in zip(scouting_reports, results):
+                if df_season is not None:
+                    all_seasons_data.append(df_season)
+                    print(f"   ✅ {report['season']} - {report['competition'][:40]} : Minutes: {minutes if minutes else 'Non trouvées'}")
+                else:
+                    print(f"   ❌ {report['season']} - {report['competition'][:40]} : échec de l'extraction")
+        else:
+            for i, report in enumerate(scouting_reports, 1):
+                print(f"\n   [{i}/{len(scouting_reports)}] {report['season']} - {report['competition'][:40]}...")
+                print(f"      -> URL: {report['url']}")
+                
+                df_season, minutes = self._scrape_single_report(
+                    url=report['url'],
+                    season=report['season'],
+                    competition=report['competition'],
+                    metadata=page_metadata if i == 1 else None
+                )
+                
+                if df_season is not None:
+                    all_seasons_data.append(df_season)
+                    print(f"   ✅ Données extraites. Minutes: {minutes if minutes else 'Non trouvées'}")
+                else:
+                    print("   ❌ Échec de l'extraction pour ce rapport.")
+
+        if len(page_metadata) > 1:
+            metadata = page_metadata
             if 'position' not in metadata or not metadata['position']:
                  metadata['position'] = self._detect_position_from_url(first_report_url_meta) 
             print(f"\n📊 Métadonnées (extraites de {first_report_url_meta}):")
@@ -404,31 +822,7 @@ class FBrefScraper:
                 print(f"   • {key:<15} : {value}")
         else:
              print(f"   ⚠️ Impossible de charger {first_report_url_meta} pour les métadonnées.")
-             metadata['position'] = self._detect_position_from_url(player_url)
-
-        all_seasons_data = []
-        
-        print(f"\n🔄 Scraping {len(scouting_reports)} saison(s)/rapport(s)...")
-        
-        for i, report in enumerate(scouting_reports, 1):
-            print(f"\n   [{i}/{len(scouting_reports)}] {report['season']} - {report['competition'][:40]}...")
-            print(f"      -> URL: {report['url']}")
-            
-            df_season, minutes = self._scrape_single_report(
-                url=report['url'],
-                season=report['season'],
-                competition=report['competition']
-            )
-            
-            if df_season is not None:
-                all_seasons_data.append(df_season)
-                print(f"   ✅ Données extraites. Minutes: {minutes if minutes else 'Non trouvées'}")
-            else:
-                print(f"   ❌ Échec de l'extraction pour ce rapport.")
-            
-            # --- CORRECTION ICI ---
-            time.sleep(1 + np.random.rand()) # Utiliser np directement
-            # --- FIN CORRECTION ---
+             metadata = {'name': player_name, 'position': self._detect_position_from_url(player_url)}
 
         if not all_seasons_data:
             print("\n❌ Aucune donnée n'a pu être extraite pour aucun rapport.")
@@ -452,13 +846,26 @@ class FBrefScraper:
             for (season, competition), minutes in grouped.items():
                  minutes_str = f"{minutes:.0f} min" if pd.notna(minutes) else "N/A"
                  # Nettoyage affichage compétition
-                 display_comp = re.sub(r'^\d+\s*', '', competition).strip()
+                 display_comp = _RE_LEADING_ID.sub('', competition).strip()
                  print(f"   • {season:<12} | {display_comp:<40} : {minutes_str}")
 
         return df_all_seasons, metadata, scouting_reports
     
+    def __enter__(self) -> 'FBrefScraper':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def close(self):
-        """Ferme le driver"""
+        """Ferme le driver (et la session HTTP éventuelle)"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self.shared:
+            # Le driver partagé reste ouvert pour les scrapers suivants (fermé par atexit)
+            self.driver = None
+            return
         if self.driver:
             try:
                 self.driver.quit()
@@ -12,6 +12,9 @@ from player_comparator import PlayerComparator
 import pandas as pd
 import csv
 
+# Suppression des virgules et guillemets (une seule passe via str.translate)
+CSV_SCRUB_TABLE = str.maketrans('', '', ',"')
+
 
 def print_banner():
     """Bannière"""
@@ -114,13 +117,12 @@ def load_or_scrape_player(player_name: str, player_url: str, output_dir: str):
                 df_all_seasons = pd.read_csv(csv_file, quoting=csv.QUOTE_ALL)
                 
                 # Reconstruire available_seasons depuis le DataFrame
-                available_seasons = []
-                for _, row in df_all_seasons[['season', 'competition']].drop_duplicates().iterrows():
-                    available_seasons.append({
-                        'season': row['season'],
-                        'competition': row['competition'],
-                        'text': f"{row['season']} {row['competition']}"
-                    })
+                # Dédoublonnage sur les 2 seules colonnes clés, sans iterrows
+                season_pairs = df_all_seasons[['season', 'competition']].drop_duplicates(ignore_index=True)
+                available_seasons = [
+                    {**pair, 'text': f"{pair['season']} {pair['competition']}"}
+                    for pair in season_pairs.to_dict('records')
+                ]
                 
                 # Extraire les métadonnées depuis le DataFrame
                 metadata = {
@@ -145,9 +147,8 @@ def load_or_scrape_player(player_name: str, player_url: str, output_dir: str):
     # Si pas de cache ou choix de rescaper
     print(f"\n📥 SCRAPING EN COURS...")
     
-    scraper = FBrefScraper(wait_time=10, headless=True)
-    
-    try:
+    # Chrome partagé : le 2e joueur d'une comparaison réutilise le même navigateur
+    with FBrefScraper(wait_time=10, headless=True, shared=True) as scraper:
         df_all_seasons, metadata, available_seasons = scraper.scrape_player_all_seasons(
             player_url=player_url,
             player_name=player_name
@@ -157,13 +158,15 @@ def load_or_scrape_player(player_name: str, player_url: str, output_dir: str):
             return None, None, []
         
         # Nettoyage des virgules et guillemets dans les textes avant sauvegarde
-        df_all_seasons = df_all_seasons.applymap(
-            lambda x: str(x).replace(',', '').replace('"', '') if isinstance(x, str) else x
-        )
+        # (colonnes object uniquement, les valeurs non-str sont conservées ; pas de .str qui
+        # lèverait une erreur sur une colonne object sans aucune chaîne)
+        for col in df_all_seasons.select_dtypes(include='object').columns:
+            df_all_seasons[col] = df_all_seasons[col].map(
+                lambda v: v.translate(CSV_SCRUB_TABLE) if isinstance(v, str) else v)
         
         # IMPORTANT: Normaliser aussi available_seasons pour correspondre au CSV
         for season in available_seasons:
-            season['competition'] = season['competition'].replace(',', '').replace('"', '')
+            season['competition'] = season['competition'].translate(CSV_SCRUB_TABLE)
             season['text'] = f"{season['season']} {season['competition']}"
         
         # Sauvegarder sans guillemets
@@ -172,9 +175,6 @@ def load_or_scrape_player(player_name: str, player_url: str, output_dir: str):
         
         
         return df_all_seasons, metadata, available_seasons
-        
-    finally:
-        scraper.close()
 
 
 def analyze_single_player():
@@ -219,19 +219,14 @@ def analyze_single_player():
     df_selected = df_all_seasons[
         (df_all_seasons['season'] == selected_season['season']) &
         (df_all_seasons['competition'] == selected_season['competition'])
-    ].copy()
+    ]
     
     if df_selected.empty:
         print(f"\n❌ Aucune donnée trouvée pour cette saison")
         return
     
-    # Ajouter métadonnées
-    season_metadata = metadata.copy()
-    for key, value in season_metadata.items():
-        if key not in df_selected.columns:
-            df_selected.insert(0, key, value)
-    
-    df_clean = cleaner.clean(df_selected, season_metadata)
+    # Métadonnées ajoutées par le cleaner (sans copier la sélection)
+    df_clean = cleaner.clean(df_selected, metadata)
     
     print(f"\n✅ Données nettoyées pour {selected_season['season']} - {selected_season['competition']}")
     
@@ -374,19 +369,14 @@ def compare_two_players():
         df_selected = player['df_all'][
             (player['df_all']['season'] == player['selected_season']['season']) &
             (player['df_all']['competition'] == player['selected_season']['competition'])
-        ].copy()
+        ]
         
         if df_selected.empty:
             print(f"❌ Aucune donnée trouvée")
             return
         
-        # Ajouter métadonnées manquantes
-        metadata = player['metadata'].copy()
-        for key, value in metadata.items():
-            if key not in df_selected.columns:
-                df_selected.insert(0, key, value)
-        
-        df_clean = cleaner.clean(df_selected, metadata)
+        # Métadonnées manquantes ajoutées par le cleaner
+        df_clean = cleaner.clean(df_selected, player['metadata'])
         cleaned_data.append(df_clean)
         
         print(f"✅")
@@ -101,7 +101,9 @@ class PlayerAnalyzer:
         # ... (Identique V21) ...
         if df is None or df.empty: print("⚠️ Erreur: Le DataFrame fourni est vide ou None."); return
         self.df = df.iloc[[0]].copy(); self.stats = {}
+        numeric_cols = set(self.df.select_dtypes(include='number').columns) # dtypes déjà numériques (DataCleaner) : pas de re-parsing
         for col in self.df.columns:
+            if col in numeric_cols: value = self.df[col].iat[0]; self.stats[col] = float(value) if not pd.isna(value) else value; continue
             try: numeric_val = pd.to_numeric(self.df[col].iloc[0], errors='coerce'); self.stats[col] = float(numeric_val) if not pd.isna(numeric_val) else self.df[col].iloc[0]
             except Exception: self.stats[col] = self.df[col].iloc[0]
         self.season = self.stats.get('season', None); self.competition = self.stats.get('competition', None)